@@ -11,9 +11,13 @@ This is ideal for complex, multi-step tasks like "Design a protocol for X and th
 """
 
 from typing import List, Dict, Any, Optional
+import asyncio
 import json
 import re
 
+# Matches "1. Step description" lines in LLM-produced plans.
+_STEP_RE = re.compile(r'^\d+\.\s+(.*)')
+
 # --- Interfaces ---
 
 class LLMAdapter:
@@ -29,14 +33,28 @@ class LLMAdapter:
             """
         return "Step executed successfully."
 
+    async def agenerate(self, prompt: str) -> str:
+        """
+        Async variant of generate(). Real adapters should override this with a
+        native async client (e.g. httpx.AsyncClient or openai.AsyncOpenAI);
+        the default just offloads the sync call to a worker thread.
+        """
+        return await asyncio.to_thread(self.generate, prompt)
+
 # --- Core Classes ---
 
+# Words that signal a step depends on the output of earlier steps.
+# Such steps act as a barrier: everything before them must finish first.
+_DEPENDENT_STEP_MARKERS = ("summar", "combine", "previous", "above", "for each", "based on")
+
+
 class PlanAndSolveAgent:
-    def __init__(self, llm: LLMAdapter, tools: Dict[str, Any] = None):
+    def __init__(self, llm: LLMAdapter, tools: Dict[str, Any] = None, max_inflight: int = 4):
         self.llm = llm
         self.tools = tools or {}
         self.current_plan: List[str] = []
         self.memory: List[str] = []
+        self.max_inflight = max_inflight
 
     def plan(self, goal: str) -> List[str]:
         """
@@ -57,64 +75,102 @@ class PlanAndSolveAgent:
         for line in response.split('\n'):
             line = line.strip()
             # Match "1. Step description"
-            match = re.match(r'^\d+\.\s+(.*)', line)
+            match = _STEP_RE.match(line)
             if match:
                 steps.append(match.group(1))
                 
         self.current_plan = steps
         return steps
 
-    def execute(self, steps: List[str]) -> str:
+    def _partition_into_batches(self, steps: List[str]) -> List[List[int]]:
         """
-        Phase 2: Execute the plan step-by-step.
+        Split the plan into batches of mutually independent steps.
+        Steps that reference earlier outputs ("summarize", "for each", ...)
+        start a new batch so they run only after everything before them.
         """
-        results = []
-        
-        print(f"--- Executing Plan ({len(steps)} steps) ---")
-        
+        batches: List[List[int]] = []
+        current: List[int] = []
         for i, step in enumerate(steps):
-            print(f"Step {i+1}: {step}")
-            
-            # Construct context from previous steps
-            context = "\n".join(results[-3:]) # Keep last 3 results as context
-            
+            lowered = step.lower()
+            if current and any(marker in lowered for marker in _DEPENDENT_STEP_MARKERS):
+                batches.append(current)
+                current = []
+            current.append(i)
+        if current:
+            batches.append(current)
+        return batches
+
+    async def execute_async(self, steps: List[str]) -> str:
+        """
+        Phase 2: Execute the plan, fanning out independent steps concurrently.
+
+        Steps within a batch share no dependencies, so their LLM calls are
+        overlapped with asyncio.gather; a semaphore caps in-flight requests
+        to respect provider rate limits.
+        """
+        results: List[str] = [""] * len(steps)
+        semaphore = asyncio.Semaphore(self.max_inflight)
+
+        async def run_step(i: int, step: str, context: str) -> None:
             prompt = f"""
             Current Step: {step}
-            
+
             Context from previous steps:
             {context}
-            
+
             Execute this step and provide the result.
             """
-            
             # In a real agent, this would involve tool selection/calling
             # Here we simulate the LLM doing the work or calling a tool
-            result = self.llm.generate(prompt)
-            
-            print(f"  -> Result: {result[:50]}...")
-            results.append(f"Step {i+1} Result: {result}")
+            async with semaphore:
+                result = await self.llm.agenerate(prompt)
+            print(f"  -> Step {i+1} Result: {result[:50]}...")
+            results[i] = f"Step {i+1} Result: {result}"
             self.memory.append(f"Step {i+1}: {step} -> {result}")
-            
+
+        batches = self._partition_into_batches(steps)
+        print(f"--- Executing Plan ({len(steps)} steps, {len(batches)} batches) ---")
+
+        done = 0
+        for batch in batches:
+            for i in batch:
+                print(f"Step {i+1}: {steps[i]}")
+            # Context for this batch: last 3 results from completed batches,
+            # keeping prompts bounded regardless of plan length
+            completed = [r for r in results[:done] if r]
+            context = "\n".join(completed[-3:])
+            await asyncio.gather(*[run_step(i, steps[i], context) for i in batch])
+            done = batch[-1] + 1
+
         return "\n".join(results)
 
-    def run(self, goal: str) -> str:
+    def execute(self, steps: List[str]) -> str:
         """
-        Main entry point: Plan then Execute.
+        Phase 2 (sync entry point): thin wrapper around execute_async.
         """
+        return asyncio.run(self.execute_async(steps))
+
+    async def _run_async(self, goal: str) -> str:
         print(f"Agent Goal: {goal}")
-        
+
         # 1. Plan
         plan = self.plan(goal)
         if not plan:
             return "Failed to generate a plan."
-            
+
         print(f"Generated Plan: {plan}")
-        
+
         # 2. Execute
-        final_report = self.execute(plan)
-        
+        final_report = await self.execute_async(plan)
+
         return final_report
 
+    def run(self, goal: str) -> str:
+        """
+        Main entry point: Plan then Execute.
+        """
+        return asyncio.run(self._run_async(goal))
+
 # --- Example Usage ---
 
 if __name__ == "__main__":
@@ -3,6 +3,29 @@ from dataclasses import dataclass
 import json
 import re
 
+try:
+    import ahocorasick  # pyahocorasick: single-pass multi-keyword matching
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# Routing keywords -> task domain. With an Aho-Corasick automaton the whole
+# map is matched in one O(len(query)) pass, so adding keywords is free;
+# the fallback substring scan is O(K * len(query)).
+KEYWORD_MAP = {
+    "drug": "chemistry",
+    "molecule": "chemistry",
+    "inhibitor": "chemistry",
+    "chemistry": "chemistry",
+    "code": "coding",
+    "implement": "coding",
+    "python": "coding",
+    "script": "coding",
+}
+
+# Domains in priority order when a query matches several
+_DOMAIN_PRIORITY = ("chemistry", "coding")
+
 @dataclass
 class AgentMessage:
     role: str
@@ -29,6 +52,26 @@ class SupervisorAgent:
         self.name = name
         self.sub_agents = {agent.name: agent for agent in sub_agents}
         self.memory: List[AgentMessage] = []
+        # Build the keyword automaton once; DFA construction cost is
+        # amortized over every routed query.
+        self._automaton = None
+        if AHOCORASICK_AVAILABLE:
+            self._automaton = ahocorasick.Automaton()
+            for keyword, domain in KEYWORD_MAP.items():
+                self._automaton.add_word(keyword, domain)
+            self._automaton.make_automaton()
+
+    def _route_domain(self, query: str) -> Optional[str]:
+        """Match all routing keywords in one pass and pick the top domain."""
+        q = query.lower()
+        if self._automaton is not None:
+            matched = {domain for _, domain in self._automaton.iter(q)}
+        else:
+            matched = {domain for keyword, domain in KEYWORD_MAP.items() if keyword in q}
+        for domain in _DOMAIN_PRIORITY:
+            if domain in matched:
+                return domain
+        return None
 
     def plan(self, user_query: str) -> List[Dict[str, str]]:
         """
@@ -36,23 +79,22 @@ class SupervisorAgent:
         Returns a list of steps: [{"agent": "Coder", "instruction": "Write python script..."}]
         """
         print(f"[{self.name}] Planning for: {user_query}")
-        
+
         # MOCK LLM OUTPUT (Simulation of a Router Chain)
         # Real implementation would prompt LLM to return JSON
-        
+
         plan = []
-        # Robust keyword matching for the demo
-        q = user_query.lower()
-        if any(k in q for k in ["drug", "molecule", "inhibitor", "chemistry"]):
+        domain = self._route_domain(user_query)
+        if domain == "chemistry":
             plan.append({"agent": "Chemist", "instruction": "Analyze molecular properties."})
             plan.append({"agent": "SafetyOfficer", "instruction": "Check for toxicity risks."})
-        elif any(k in q for k in ["code", "implement", "python", "script"]):
+        elif domain == "coding":
              plan.append({"agent": "Coder", "instruction": "Generate the requested code."})
              plan.append({"agent": "Reviewer", "instruction": "Review code for bugs."})
         else:
             # Fallback if no specific domain detected, try to use a default or just log
             plan.append({"agent": "Chemist", "instruction": "General scientific analysis."})
-            
+
         return plan
 
     def execute_workflow(self, user_query: str) -> Dict[str, Any]:
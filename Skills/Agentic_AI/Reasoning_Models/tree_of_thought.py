@@ -7,7 +7,7 @@ reasoning paths, evaluating intermediate steps, and backtracking when necessary.
 
 Features:
 - Generic state representation for any problem domain
-- Pluggable search strategies (BFS, DFS)
+- Pluggable search strategies (BFS, DFS, best-first)
 - LLM-based state evaluation (self-reflection)
 - Decomposition of complex problems into steps
 - Structured prompt management
@@ -20,13 +20,25 @@ Version: 2.0.0
 Date: January 2026
 """
 
-from typing import List, Dict, Any, Optional, Callable, Tuple, Union
+from typing import List, Dict, Any, Optional, Callable, Tuple, Union, Iterator
 from dataclasses import dataclass, field
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+import hashlib
 import heapq
 import json
+import re
 import time
 
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# Extracts the numeric score from an evaluator LLM response.
+_SCORE_RE = re.compile(r"0\.\d+|1\.0|1")
+
 
 # --- Interfaces ---
 
@@ -41,6 +53,18 @@ class Evaluator(ABC):
         """
         pass
 
+    def evaluate_batch(self, states: List[str], problem_description: str,
+                       max_workers: int = 16) -> List[float]:
+        """
+        Evaluate several states at once. The default fans independent
+        evaluate() calls out over a thread pool; subclasses with a batched
+        backend should override to submit one request for the whole batch.
+        """
+        if len(states) <= 1 or max_workers <= 1:
+            return [self.evaluate(s, problem_description) for s in states]
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(states))) as ex:
+            return list(ex.map(lambda s: self.evaluate(s, problem_description), states))
+
 class Generator(ABC):
     """Abstract base class for thought generators."""
     
@@ -53,61 +77,161 @@ class Generator(ABC):
 # --- LLM Adapter ---
 
 class LLMAdapter(ABC):
-    """Interface for LLM interaction."""
+    """
+    Interface for LLM interaction.
+
+    `system` carries the static instruction block separately from the
+    per-call user prompt. Backends with prefix caching (vLLM/SGLang radix
+    cache, Anthropic prompt caching) can then reuse the KV cache for the
+    system block across calls instead of re-prefilling it every time.
+    """
     
     @abstractmethod
-    def generate(self, prompt: str, temperature: float = 0.7) -> str:
+    def generate(self, prompt: str, temperature: float = 0.7,
+                 system: Optional[str] = None) -> str:
         pass
 
+    def generate_batch(self, prompts: List[str], temperature: float = 0.7,
+                       system: Optional[str] = None) -> List[str]:
+        """
+        Generate completions for a batch of prompts. Backends served by
+        vLLM/SGLang should override this to submit the whole list in one
+        request so the server co-executes it via continuous batching; the
+        default simply loops.
+        """
+        return [self.generate(p, temperature=temperature, system=system)
+                for p in prompts]
+
+    def stream(self, prompt: str, temperature: float = 0.7,
+               system: Optional[str] = None) -> Iterator[str]:
+        """
+        Yield the completion incrementally. Streaming backends should
+        override this (OpenAI stream=True, vLLM streaming) and honor
+        close() by cancelling the server-side generation, so callers that
+        stop early do not pay for the remaining output tokens. The default
+        yields the full generate() output as a single chunk.
+        """
+        yield self.generate(prompt, temperature=temperature, system=system)
+
 
 class MockLLM(LLMAdapter):
     """Mock LLM for testing without API costs."""
     
-    def generate(self, prompt: str, temperature: float = 0.7) -> str:
+    def generate(self, prompt: str, temperature: float = 0.7,
+                 system: Optional[str] = None) -> str:
         # Simple heuristic response generation for demo purposes
-        if "evaluate" in prompt.lower():
+        text = f"{system or ''}\n{prompt}".lower()
+        if "evaluate" in text:
             return "0.8"  # High confidence mock
-        if "generate" in prompt.lower():
+        if "generate" in text:
             return "Step 1\nStep 2\nStep 3"
         return "Generic thought"
 
 
 # --- Core ToT Components ---
 
-@dataclass
+@dataclass(slots=True)
 class SearchNode:
     """A node in the reasoning tree."""
     state: str
     parent: Optional['SearchNode']
     score: float
     depth: int
-    path_history: List[str] = field(default_factory=list)
-    
+    # Memoized full reasoning chain; filled on first get_full_path() call
+    # (or seeded by the search loop, which already built the string).
+    _cached_path: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+
     def __lt__(self, other):
         # For priority queue (max-heap behavior needs negative score if using min-heap)
         return self.score > other.score
 
     def get_full_path(self) -> str:
-        """Reconstruct the full reasoning chain."""
-        return "\n".join(self.path_history + [self.state])
+        """Return the full reasoning chain, built once from the parent's."""
+        if self._cached_path is None:
+            if self.parent is None:
+                self._cached_path = self.state
+            else:
+                self._cached_path = self.parent.get_full_path() + "\n" + self.state
+        return self._cached_path
 
 
 class LLMEvaluator(Evaluator):
-    """Uses an LLM to evaluate state promise."""
-    
-    def __init__(self, llm: LLMAdapter):
+    """
+    Uses an LLM to evaluate state promise.
+
+    Evaluations are cached in two tiers, since ToT revisits near-identical
+    partial reasoning chains constantly:
+    1. Exact match: blake2b hash of (problem, state) -> score.
+    2. Semantic (optional): if an `embedder` callable is supplied, states
+       whose embeddings have cosine similarity above `similarity_threshold`
+       with a previously scored state reuse its score without an LLM call.
+    """
+
+    def __init__(
+        self,
+        llm: LLMAdapter,
+        embedder: Optional[Callable[[str], Any]] = None,
+        similarity_threshold: float = 0.95
+    ):
         self.llm = llm
+        self.embedder = embedder
+        self.similarity_threshold = similarity_threshold
+        self._exact: Dict[bytes, float] = {}
+        self._embeddings: List[Any] = []
+        self._semantic_scores: List[float] = []
+        self.cache_hits = 0
+
+    @staticmethod
+    def _cache_key(state: str, problem_description: str) -> bytes:
+        return hashlib.blake2b(
+            f"{problem_description}\n{state}".encode(), digest_size=16
+        ).digest()
+
+    def _semantic_lookup(self, state: str, problem_description: str) -> Tuple[Optional[float], Any]:
+        """Return (cached_score, embedding) — score is None on a miss."""
+        if self.embedder is None or not NUMPY_AVAILABLE:
+            return None, None
+
+        emb = np.asarray(self.embedder(f"{problem_description}\n{state}"), dtype=np.float32)
+        norm = np.linalg.norm(emb)
+        if norm == 0:
+            return None, None
+        emb = emb / norm
+
+        if self._embeddings:
+            sims = np.stack(self._embeddings) @ emb
+            best = int(np.argmax(sims))
+            if sims[best] >= self.similarity_threshold:
+                return self._semantic_scores[best], emb
+        return None, emb
 
     def evaluate(self, state: str, problem_description: str) -> float:
-        prompt = f"""
-        Evaluate the following reasoning step towards solving the problem. 
+        key = self._cache_key(state, problem_description)
+        if key in self._exact:
+            self.cache_hits += 1
+            return self._exact[key]
+
+        cached, emb = self._semantic_lookup(state, problem_description)
+        if cached is not None:
+            self.cache_hits += 1
+            self._exact[key] = cached
+            return cached
+
+        score = self._evaluate_uncached(state, problem_description)
+
+        self._exact[key] = score
+        if emb is not None:
+            self._embeddings.append(emb)
+            self._semantic_scores.append(score)
+        return score
+
+    # Static instruction block — identical for every call, so prefix-caching
+    # backends only prefill it once. The variable state goes last in the
+    # user prompt for the same reason.
+    SYSTEM_PROMPT = """
+        You evaluate reasoning steps towards solving a problem.
         
-        Problem: {problem_description}
-        
-        Current Reasoning State:
-        {state}
-        
-        Assess whether this step is:
+        Assess whether the given step is:
         - Impossible/Wrong (0.1)
         - Unlikely to work (0.3)
         - Plausible (0.5)
@@ -116,18 +240,78 @@ class LLMEvaluator(Evaluator):
         
         Return ONLY the numeric score (0.0 to 1.0).
         """
+
+    @staticmethod
+    def _build_prompt(state: str, problem_description: str) -> str:
+        return f"""
+        Problem: {problem_description}
+        
+        Current Reasoning State:
+        {state}
+        """
+
+    def _evaluate_uncached(self, state: str, problem_description: str) -> float:
+        prompt = self._build_prompt(state, problem_description)
         
         try:
-            response = self.llm.generate(prompt, temperature=0.1).strip()
-            # Extract float from response
-            import re
-            match = re.search(r"0\.\d+|1\.0|1", response)
-            if match:
-                return float(match.group(0))
-            return 0.5 # Default fallback
+            response = self.llm.generate(
+                prompt, temperature=0.1, system=self.SYSTEM_PROMPT
+            )
+            return self._parse_score(response)
         except Exception:
             return 0.5
 
+    @staticmethod
+    def _parse_score(response: str) -> float:
+        match = _SCORE_RE.search(response.strip())
+        if match:
+            return float(match.group(0))
+        return 0.5 # Default fallback
+
+    def evaluate_batch(self, states: List[str], problem_description: str,
+                       max_workers: int = 16) -> List[float]:
+        """
+        Batched evaluation. Cache hits are resolved up front and duplicate
+        states coalesced; the remaining misses go to the adapter in a single
+        generate_batch call when the backend overrides it (one continuously
+        batched forward pass on vLLM/SGLang), otherwise through the threaded
+        default.
+        """
+        scores: List[Optional[float]] = [None] * len(states)
+
+        # Resolve exact-cache hits and coalesce duplicate misses
+        miss_keys: Dict[bytes, List[int]] = {}
+        for i, state in enumerate(states):
+            key = self._cache_key(state, problem_description)
+            if key in self._exact:
+                self.cache_hits += 1
+                scores[i] = self._exact[key]
+            else:
+                miss_keys.setdefault(key, []).append(i)
+
+        if miss_keys:
+            miss_indices = [idxs[0] for idxs in miss_keys.values()]
+            miss_states = [states[i] for i in miss_indices]
+
+            if type(self.llm).generate_batch is not LLMAdapter.generate_batch:
+                prompts = [self._build_prompt(s, problem_description)
+                           for s in miss_states]
+                responses = self.llm.generate_batch(
+                    prompts, temperature=0.1, system=self.SYSTEM_PROMPT
+                )
+                miss_scores = [self._parse_score(r) for r in responses]
+            else:
+                miss_scores = super().evaluate_batch(
+                    miss_states, problem_description, max_workers=max_workers
+                )
+
+            for (key, idxs), score in zip(miss_keys.items(), miss_scores):
+                self._exact[key] = score
+                for i in idxs:
+                    scores[i] = score
+
+        return scores
+
 
 class LLMGenerator(Generator):
     """Uses an LLM to generate next thoughts."""
@@ -135,22 +319,47 @@ class LLMGenerator(Generator):
     def __init__(self, llm: LLMAdapter):
         self.llm = llm
 
+    SYSTEM_PROMPT = """
+        You are an intelligent problem solver.
+        
+        Generate distinct, valid next steps (thoughts) that move closer to
+        the solution. Provide each thought on a new line.
+        """
+
     def generate_thoughts(self, state: str, problem_description: str, n: int) -> List[str]:
         prompt = f"""
-        You are an intelligent problem solver. 
-        
         Problem: {problem_description}
         
+        Generate {n} thoughts.
+        
         Current State:
         {state}
-        
-        Generate {n} distinct, valid next steps (thoughts) to move closer to the solution.
-        Provide each thought on a new line.
         """
         
-        response = self.llm.generate(prompt, temperature=0.7)
-        thoughts = [line.strip() for line in response.split('\n') if line.strip()]
-        return thoughts[:n]
+        # Consume the response as a stream and stop as soon as n thoughts
+        # have arrived — closing the iterator cancels the rest of the
+        # generation on streaming backends, saving latency and tokens.
+        thoughts: List[str] = []
+        buffer = ""
+        chunks = self.llm.stream(prompt, temperature=0.7, system=self.SYSTEM_PROMPT)
+        try:
+            for chunk in chunks:
+                buffer += chunk
+                while '\n' in buffer:
+                    line, buffer = buffer.split('\n', 1)
+                    line = line.strip()
+                    if line:
+                        thoughts.append(line)
+                    if len(thoughts) >= n:
+                        return thoughts
+        finally:
+            if hasattr(chunks, "close"):
+                chunks.close()
+
+        tail = buffer.strip()
+        if tail and len(thoughts) < n:
+            thoughts.append(tail)
+        return thoughts
 
 
 # --- Search Algorithms ---
@@ -172,7 +381,10 @@ class TreeOfThoughtSolver:
         generator: Optional[Generator] = None,
         strategy: str = "bfs",
         max_depth: int = 5,
-        branching_factor: int = 3
+        branching_factor: int = 3,
+        beam_width: int = 5,
+        max_workers: int = 16,
+        node_budget: int = 256
     ):
         self.llm = llm or MockLLM()
         self.evaluator = evaluator or LLMEvaluator(self.llm)
@@ -180,13 +392,52 @@ class TreeOfThoughtSolver:
         self.strategy = strategy
         self.max_depth = max_depth
         self.branching_factor = branching_factor
+        self.beam_width = beam_width
+        self.max_workers = max_workers
+        self.node_budget = node_budget
         self.nodes_explored = 0
+        # Thought cache for the current run: generation state -> thoughts.
+        # Beams routinely contain nodes with identical states (the LLM emits
+        # duplicate thoughts), and one expensive call covers all of them.
+        self._thought_cache: Dict[str, List[str]] = {}
+        # Digests of reasoning chains already expanded this run. Different
+        # paths converging on the same state are expanded only once, saving
+        # every downstream LLM call the duplicate subtree would have made.
+        self._visited: set = set()
+
+    @staticmethod
+    def _state_digest(full_state: str) -> bytes:
+        """Hash of the whitespace-normalized, lowercased reasoning chain."""
+        normalized = " ".join(full_state.lower().split())
+        return hashlib.blake2b(normalized.encode(), digest_size=16).digest()
+
+    def _prune_beam(self, candidates: List[SearchNode]) -> List[SearchNode]:
+        """
+        Keep the top beam_width candidates by score.
+        Uses numpy argpartition (O(N) selection in C) instead of a full
+        Python object sort — the difference matters once parallel expansion
+        produces hundreds of candidates per level.
+        """
+        k = self.beam_width
+        if len(candidates) <= k:
+            return sorted(candidates, key=lambda x: x.score, reverse=True)
+        if NUMPY_AVAILABLE:
+            scores = np.fromiter(
+                (n.score for n in candidates), dtype=np.float32, count=len(candidates)
+            )
+            idx = np.argpartition(-scores, k - 1)[:k]
+            beam = [candidates[i] for i in idx]
+            beam.sort(key=lambda x: x.score, reverse=True)
+            return beam
+        return heapq.nlargest(k, candidates, key=lambda x: x.score)
 
     def solve(self, problem: str) -> Dict[str, Any]:
         """
         Run the ToT search to solve the problem.
         """
         self.nodes_explored = 0
+        self._thought_cache = {}
+        self._visited = set()
         start_time = time.time()
         
         # Initial node
@@ -194,14 +445,15 @@ class TreeOfThoughtSolver:
             state="Start",
             parent=None,
             score=0.5,
-            depth=0,
-            path_history=[]
+            depth=0
         )
         
         if self.strategy == "bfs":
             result_node = self._bfs(root, problem)
         elif self.strategy == "dfs":
             result_node = self._dfs(root, problem)
+        elif self.strategy == "best_first":
+            result_node = self._best_first(root, problem)
         else:
             raise ValueError(f"Unknown strategy: {self.strategy}")
             
@@ -228,55 +480,130 @@ class TreeOfThoughtSolver:
         """Breadth-First Search (Beam Search logic can be added here)."""
         queue = [root]
         best_solution = None
-        
+
         # Level-wise iteration
         for depth in range(self.max_depth):
             print(f"ToT Depth {depth}: {len(queue)} candidates")
-            next_queue = []
-            
+
             for node in queue:
                 if node.score >= 0.9: # Early exit for high confidence
                     return node
-                
-                # Generate thoughts
-                thoughts = self.generator.generate_thoughts(
-                    node.state if node.state != "Start" else "", 
-                    problem, 
-                    self.branching_factor
+
+            # All generation calls at a level are independent LLM
+            # round-trips, so fan them out across a thread pool — but only
+            # one call per *unique* state; duplicates share the result.
+            gen_states = [n.state if n.state != "Start" else "" for n in queue]
+            pending = list({s for s in gen_states if s not in self._thought_cache})
+            if pending:
+                with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                    generated = list(executor.map(
+                        lambda s: self.generator.generate_thoughts(
+                            s, problem, self.branching_factor
+                        ),
+                        pending
+                    ))
+                self._thought_cache.update(zip(pending, generated))
+            thoughts_per_node = [self._thought_cache[s] for s in gen_states]
+
+            pairs = [
+                (node, thought)
+                for node, thoughts in zip(queue, thoughts_per_node)
+                for thought in thoughts
+            ]
+            self.nodes_explored += len(pairs)
+
+            # Evaluate all (node, thought) candidates in one batch — a
+            # batching-aware evaluator submits a single request here
+            full_states = [node.get_full_path() + "\n" + thought
+                           for node, thought in pairs]
+            scores = self.evaluator.evaluate_batch(
+                full_states, problem, max_workers=self.max_workers
+            )
+
+            next_queue = []
+            for (node, thought), full_state, score in zip(pairs, full_states, scores):
+                if score < 0.3: # Prune bad paths
+                    continue
+
+                digest = self._state_digest(full_state)
+                if digest in self._visited: # Converged with an expanded path
+                    continue
+                self._visited.add(digest)
+
+                child = SearchNode(
+                    state=thought,
+                    parent=node,
+                    score=score,
+                    depth=depth + 1
                 )
-                
-                for thought in thoughts:
-                    self.nodes_explored += 1
-                    
-                    # Evaluate
-                    full_state = node.get_full_path() + "\n" + thought
-                    score = self.evaluator.evaluate(full_state, problem)
-                    
-                    if score < 0.3: # Prune bad paths
-                        continue
-                        
-                    child = SearchNode(
-                        state=thought,
-                        parent=node,
-                        score=score,
-                        depth=depth + 1,
-                        path_history=node.path_history + [node.state]
-                    )
-                    
-                    next_queue.append(child)
-                    
-                    if score >= 0.9: # Found a solution
-                        return child
+                child._cached_path = full_state
+
+                next_queue.append(child)
+
+                if score >= 0.9: # Found a solution
+                    return child
 
             # Beam Search: keep top K candidates per level
-            next_queue.sort(key=lambda x: x.score, reverse=True)
-            queue = next_queue[:5] # Beam width of 5
-            
+            queue = self._prune_beam(next_queue)
+
             if not queue:
                 break
-                
+
         return queue[0] if queue else None
 
+    def _best_first(self, root: SearchNode, problem: str) -> Optional[SearchNode]:
+        """
+        Best-first search over a global max-heap keyed on score.
+
+        Unlike the fixed-beam BFS, the most promising branch is expanded
+        next regardless of depth, which typically reaches a >=0.9 solution
+        with far fewer expansions. node_budget caps total LLM spend.
+        """
+        heap = [root]
+        best_node = root
+
+        while heap and self.nodes_explored < self.node_budget:
+            node = heapq.heappop(heap)
+
+            if node.score >= 0.9:
+                return node
+            if node.score > best_node.score:
+                best_node = node
+            if node.depth >= self.max_depth:
+                continue
+
+            gen_state = node.state if node.state != "Start" else ""
+            thoughts = self._thought_cache.get(gen_state)
+            if thoughts is None:
+                thoughts = self.generator.generate_thoughts(
+                    gen_state, problem, self.branching_factor
+                )
+                self._thought_cache[gen_state] = thoughts
+
+            full_states = [node.get_full_path() + "\n" + t for t in thoughts]
+            scores = self.evaluator.evaluate_batch(
+                full_states, problem, max_workers=self.max_workers
+            )
+
+            for thought, full_state, score in zip(thoughts, full_states, scores):
+                self.nodes_explored += 1
+                if score < 0.3: # Prune bad paths
+                    continue
+                digest = self._state_digest(full_state)
+                if digest in self._visited:
+                    continue
+                self._visited.add(digest)
+                child = SearchNode(
+                    state=thought,
+                    parent=node,
+                    score=score,
+                    depth=node.depth + 1
+                )
+                child._cached_path = full_state
+                heapq.heappush(heap, child)
+
+        return best_node
+
     def _dfs(self, root: SearchNode, problem: str) -> Optional[SearchNode]:
         """Depth-First Search."""
         stack = [root]
@@ -293,11 +620,13 @@ class TreeOfThoughtSolver:
             if node.score >= 0.9:
                 return node
                 
-            thoughts = self.generator.generate_thoughts(
-                node.state if node.state != "Start" else "", 
-                problem, 
-                self.branching_factor
-            )
+            gen_state = node.state if node.state != "Start" else ""
+            thoughts = self._thought_cache.get(gen_state)
+            if thoughts is None:
+                thoughts = self.generator.generate_thoughts(
+                    gen_state, problem, self.branching_factor
+                )
+                self._thought_cache[gen_state] = thoughts
             
             # Add to stack (reverse to process first generated first)
             for thought in reversed(thoughts):
@@ -307,13 +636,17 @@ class TreeOfThoughtSolver:
                 
                 if score < 0.3: continue
                 
+                digest = self._state_digest(full_state)
+                if digest in self._visited: continue
+                self._visited.add(digest)
+                
                 child = SearchNode(
                     state=thought,
                     parent=node,
                     score=score,
-                    depth=node.depth + 1,
-                    path_history=node.path_history + [node.state]
+                    depth=node.depth + 1
                 )
+                child._cached_path = full_state
                 stack.append(child)
                 
         return best_node
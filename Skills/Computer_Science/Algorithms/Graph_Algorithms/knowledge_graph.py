@@ -18,7 +18,134 @@ import heapq
 from collections import deque
 import json
 
-@dataclass
+import numpy as np
+
+try:
+    import orjson  # ~10x faster than stdlib json on dict-heavy payloads
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """No-op decorator so the kernels still run as plain Python."""
+        def wrap(fn):
+            return fn
+        return wrap
+
+
+@njit(cache=True)
+def _bfs_csr(indptr: np.ndarray, indices: np.ndarray, start: int,
+             max_depth: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    BFS over a CSR graph. Returns (node_indices, depths) in visit order.
+    Tight integer loop over contiguous arrays — compiled to native code
+    when numba is installed (cache=True avoids re-JIT across processes).
+    """
+    n = indptr.shape[0] - 1
+    # Flat uint8 visited array: membership checks are single indexed byte
+    # loads instead of hashed set operations.
+    visited = np.zeros(n, np.uint8)
+    queue = np.empty(n, np.int32)
+    depths = np.empty(n, np.int32)
+
+    head = 0
+    tail = 0
+    queue[tail] = start
+    depths[tail] = 0
+    tail += 1
+    visited[start] = 1
+
+    while head < tail:
+        u = queue[head]
+        d = depths[head]
+        head += 1
+        if d < max_depth:
+            for k in range(indptr[u], indptr[u + 1]):
+                v = indices[k]
+                if visited[v] == 0:
+                    visited[v] = 1
+                    queue[tail] = v
+                    depths[tail] = d + 1
+                    tail += 1
+
+    return queue[:tail], depths[:tail]
+
+
+@njit(cache=True)
+def _bidirectional_sp_csr(indptr: np.ndarray, indices: np.ndarray,
+                          rindptr: np.ndarray, rindices: np.ndarray,
+                          start: int, end: int) -> Tuple[int, np.ndarray, np.ndarray]:
+    """
+    Bidirectional unweighted shortest-path BFS over forward and reverse CSR.
+    Expands the smaller frontier level-by-level from each end and stops when
+    the searches meet, visiting O(2*b^(d/2)) nodes instead of O(b^d).
+    Returns (meet_node, fwd_parent, bwd_parent); meet_node == -1 means
+    end is unreachable.
+    """
+    n = indptr.shape[0] - 1
+    fwd_parent = np.full(n, -1, np.int32)
+    bwd_parent = np.full(n, -1, np.int32)
+    fwd_dist = np.full(n, -1, np.int32)
+    bwd_dist = np.full(n, -1, np.int32)
+
+    fwd_queue = np.empty(n, np.int32)
+    bwd_queue = np.empty(n, np.int32)
+    fwd_head, fwd_tail = 0, 1
+    bwd_head, bwd_tail = 0, 1
+    fwd_queue[0] = start
+    bwd_queue[0] = end
+    fwd_dist[start] = 0
+    bwd_dist[end] = 0
+
+    best_meet = -1
+    best_len = np.iinfo(np.int32).max
+
+    while fwd_head < fwd_tail and bwd_head < bwd_tail:
+        # Expand the smaller frontier one full level
+        if fwd_tail - fwd_head <= bwd_tail - bwd_head:
+            level_end = fwd_tail
+            while fwd_head < level_end:
+                u = fwd_queue[fwd_head]
+                fwd_head += 1
+                for k in range(indptr[u], indptr[u + 1]):
+                    v = indices[k]
+                    if fwd_dist[v] == -1:
+                        fwd_dist[v] = fwd_dist[u] + 1
+                        fwd_parent[v] = u
+                        fwd_queue[fwd_tail] = v
+                        fwd_tail += 1
+                        if bwd_dist[v] != -1 and fwd_dist[v] + bwd_dist[v] < best_len:
+                            best_len = fwd_dist[v] + bwd_dist[v]
+                            best_meet = v
+        else:
+            level_end = bwd_tail
+            while bwd_head < level_end:
+                u = bwd_queue[bwd_head]
+                bwd_head += 1
+                for k in range(rindptr[u], rindptr[u + 1]):
+                    v = rindices[k]
+                    if bwd_dist[v] == -1:
+                        bwd_dist[v] = bwd_dist[u] + 1
+                        bwd_parent[v] = u
+                        bwd_queue[bwd_tail] = v
+                        bwd_tail += 1
+                        if fwd_dist[v] != -1 and fwd_dist[v] + bwd_dist[v] < best_len:
+                            best_len = fwd_dist[v] + bwd_dist[v]
+                            best_meet = v
+
+        if best_meet != -1:
+            break
+
+    return best_meet, fwd_parent, bwd_parent
+
+
+@dataclass(slots=True)
 class Entity:
     """Represents a node in the Knowledge Graph."""
     id: str
@@ -28,7 +155,7 @@ class Entity:
     def __hash__(self):
         return hash(self.id)
 
-@dataclass
+@dataclass(slots=True)
 class Relation:
     """Represents an edge between two entities."""
     source_id: str
@@ -38,16 +165,31 @@ class Relation:
     properties: Dict[str, Any] = field(default_factory=dict)
 
 class KnowledgeGraph:
+    # CSR arrays persisted by save()/load()
+    _CSR_ARRAYS = ("indptr", "indices", "weights", "rindptr", "rindices")
+
     def __init__(self):
         self.nodes: Dict[str, Entity] = {}
         self.adjacency: Dict[str, List[Relation]] = {}
-    
+        # Compressed Sparse Row (CSR) view, built by finalize(). Traversals
+        # then touch contiguous int32/float32 arrays (8 bytes per edge)
+        # instead of chasing pointers through per-edge Relation objects.
+        self.indptr: Optional[np.ndarray] = None
+        self.indices: Optional[np.ndarray] = None
+        self.weights: Optional[np.ndarray] = None
+        # Reverse CSR (incoming edges), used by bidirectional search
+        self.rindptr: Optional[np.ndarray] = None
+        self.rindices: Optional[np.ndarray] = None
+        self.id_to_idx: Dict[str, int] = {}
+        self.idx_to_id: List[str] = []
+
     def add_node(self, id: str, type: str, **kwargs):
         """Add a node to the graph."""
         if id not in self.nodes:
             self.nodes[id] = Entity(id=id, type=type, properties=kwargs)
             self.adjacency[id] = []
-    
+            self.indptr = None  # Invalidate the CSR view
+
     def add_edge(self, source: str, target: str, type: str, weight: float = 1.0, **kwargs):
         """Add a directed edge between two nodes."""
         # Ensure nodes exist
@@ -55,13 +197,99 @@ class KnowledgeGraph:
             self.add_node(source, "Unknown")
         if target not in self.nodes:
             self.add_node(target, "Unknown")
-            
+
         relation = Relation(source, target, type, weight, kwargs)
         self.adjacency[source].append(relation)
-        
+        self.indptr = None  # Invalidate the CSR view
+
         # For undirected graphs, you would uncomment:
         # self.adjacency[target].append(Relation(target, source, type, weight, kwargs))
 
+    def finalize(self):
+        """
+        Freeze the current topology into a CSR (Compressed Sparse Row) layout.
+        Call after loading the graph; traversal methods automatically use the
+        compact arrays once built. Mutating the graph invalidates the view
+        (it is rebuilt lazily on the next traversal).
+        """
+        self.idx_to_id = list(self.nodes.keys())
+        self.id_to_idx = {node_id: i for i, node_id in enumerate(self.idx_to_id)}
+
+        n = len(self.idx_to_id)
+        self.indptr = np.zeros(n + 1, dtype=np.int32)
+        indices: List[int] = []
+        weights: List[float] = []
+
+        for i, node_id in enumerate(self.idx_to_id):
+            rels = self.adjacency.get(node_id, [])
+            self.indptr[i + 1] = self.indptr[i] + len(rels)
+            for rel in rels:
+                indices.append(self.id_to_idx[rel.target_id])
+                weights.append(rel.weight)
+
+        self.indices = np.asarray(indices, dtype=np.int32)
+        self.weights = np.asarray(weights, dtype=np.float32)
+
+        # Reverse CSR: bucket edges by target via counting sort
+        self.rindptr = np.zeros(n + 1, dtype=np.int32)
+        for v in self.indices:
+            self.rindptr[v + 1] += 1
+        np.cumsum(self.rindptr, out=self.rindptr)
+        self.rindices = np.empty(len(self.indices), dtype=np.int32)
+        cursor = self.rindptr[:-1].copy()
+        for u in range(n):
+            for k in range(self.indptr[u], self.indptr[u + 1]):
+                v = self.indices[k]
+                self.rindices[cursor[v]] = u
+                cursor[v] += 1
+
+    def save(self, path: str):
+        """
+        Persist the CSR arrays to `<path>.<name>.npy` files plus an id/type
+        sidecar at `<path>.idx.json`. Load with KnowledgeGraph.load(path).
+        One .npy per array (rather than a .npz bundle) because numpy can
+        only memory-map standalone .npy files, not members of a zip.
+        """
+        if not self._ensure_csr():
+            raise ValueError("Cannot save an empty graph.")
+        for name in self._CSR_ARRAYS:
+            np.save(f"{path}.{name}.npy", getattr(self, name))
+        with open(path + ".idx.json", "w", encoding="utf-8") as f:
+            json.dump({
+                "ids": self.idx_to_id,
+                "types": [self.nodes[node_id].type for node_id in self.idx_to_id]
+            }, f)
+
+    @classmethod
+    def load(cls, path: str) -> "KnowledgeGraph":
+        """
+        Load a graph saved with save(). The CSR arrays are memory-mapped, so
+        startup cost is an mmap syscall instead of O(E) Python work and the
+        OS shares the pages across processes. The result is a read-only
+        traversal snapshot: Relation objects are not reconstructed, so use
+        the original builder if the graph needs further mutation.
+        """
+        kg = cls()
+        for name in cls._CSR_ARRAYS:
+            setattr(kg, name, np.load(f"{path}.{name}.npy", mmap_mode="r"))
+
+        with open(path + ".idx.json", "r", encoding="utf-8") as f:
+            meta = json.load(f)
+        kg.idx_to_id = meta["ids"]
+        kg.id_to_idx = {node_id: i for i, node_id in enumerate(kg.idx_to_id)}
+        for node_id, node_type in zip(meta["ids"], meta["types"]):
+            kg.nodes[node_id] = Entity(id=node_id, type=node_type)
+            kg.adjacency[node_id] = []
+        return kg
+
+    def _ensure_csr(self) -> bool:
+        """Build the CSR view if stale; returns False for an empty graph."""
+        if not self.nodes:
+            return False
+        if self.indptr is None:
+            self.finalize()
+        return True
+
     def get_neighbors(self, node_id: str) -> List[Tuple[Entity, Relation]]:
         """Get all directly connected nodes and the relations connecting them."""
         if node_id not in self.adjacency:
@@ -78,21 +306,14 @@ class KnowledgeGraph:
         Perform Breadth-First Search to explore the neighborhood of a node.
         Yields (node_id, depth).
         """
-        if start_id not in self.nodes:
+        if start_id not in self.nodes or not self._ensure_csr():
             return
-            
-        visited = {start_id}
-        queue = deque([(start_id, 0)])
-        
-        while queue:
-            current_id, depth = queue.popleft()
-            yield current_id, depth
-            
-            if depth < max_depth:
-                for rel in self.adjacency.get(current_id, []):
-                    if rel.target_id not in visited:
-                        visited.add(rel.target_id)
-                        queue.append((rel.target_id, depth + 1))
+
+        order, depths = _bfs_csr(
+            self.indptr, self.indices, self.id_to_idx[start_id], max_depth
+        )
+        for i in range(len(order)):
+            yield self.idx_to_id[order[i]], int(depths[i])
 
     def find_shortest_path(self, start_id: str, end_id: str) -> Optional[List[str]]:
         """
@@ -101,56 +322,77 @@ class KnowledgeGraph:
         """
         if start_id not in self.nodes or end_id not in self.nodes:
             return None
-            
-        queue = deque([(start_id, [start_id])])
-        visited = {start_id}
-        
-        while queue:
-            current_id, path = queue.popleft()
-            
-            if current_id == end_id:
-                return path
-            
-            for rel in self.adjacency.get(current_id, []):
-                if rel.target_id not in visited:
-                    visited.add(rel.target_id)
-                    new_path = list(path)
-                    new_path.append(rel.target_id)
-                    queue.append((rel.target_id, new_path))
-                    
-        return None
-
-    def find_pathways(self, start_id: str, end_id: str, max_depth: int = 4) -> List[List[Tuple[str, str, str]]]:
+        if not self._ensure_csr():
+            return None
+
+        start = self.id_to_idx[start_id]
+        end = self.id_to_idx[end_id]
+        if start == end:
+            return [start_id]
+
+        meet, fwd_parent, bwd_parent = _bidirectional_sp_csr(
+            self.indptr, self.indices, self.rindptr, self.rindices, start, end
+        )
+        if meet == -1:
+            return None
+
+        # Walk fwd_parent back from the meet point to start...
+        path = []
+        node = meet
+        while node != -1:
+            path.append(self.idx_to_id[node])
+            node = int(fwd_parent[node])
+        path.reverse()
+
+        # ...then bwd_parent forward from the meet point to end
+        node = int(bwd_parent[meet])
+        while node != -1:
+            path.append(self.idx_to_id[node])
+            node = int(bwd_parent[node])
+        return path
+
+    def find_pathways(self, start_id: str, end_id: str, max_depth: int = 4) -> Generator[List[Tuple[str, str, str]], None, None]:
         """
-        Find all paths between two nodes up to max_depth.
-        Returns list of paths, where each path is a list of (source, relation, target) tuples.
+        Find all paths between two nodes up to max_depth, yielded lazily.
+        Each path is a list of (source, relation, target) tuples.
+        Being a generator, callers can stop after the first few paths without
+        paying for the full exhaustive search; wrap in list() for all paths.
         """
-        results = []
-        
-        def dfs(current_id: str, target_id: str, path: List[Tuple[str, str, str]], depth: int, visited: Set[str]):
-            if current_id == target_id and path:
-                results.append(list(path))
-                return
-            
-            if depth >= max_depth:
-                return
-            
-            visited.add(current_id)
-            
-            for rel in self.adjacency.get(current_id, []):
-                if rel.target_id not in visited:
-                    path.append((rel.source_id, rel.type, rel.target_id))
-                    dfs(rel.target_id, target_id, path, depth + 1, visited)
-                    path.pop()
-            
-            visited.remove(current_id)
-
-        dfs(start_id, end_id, [], 0, set())
-        return results
+        if start_id not in self.nodes or end_id not in self.nodes or max_depth <= 0:
+            return
+
+        # Iterative DFS: each stack frame is (node_id, edge_iterator, depth),
+        # avoiding Python call overhead per expansion and deep recursion limits.
+        stack = [(start_id, iter(self.adjacency.get(start_id, ())), 0)]
+        path_edges: List[Tuple[str, str, str]] = []
+        visited = {start_id}
+
+        while stack:
+            node_id, edge_iter, depth = stack[-1]
+            rel = next(edge_iter, None)
+
+            if rel is None:
+                # Frame exhausted: backtrack
+                stack.pop()
+                visited.discard(node_id)
+                if path_edges:
+                    path_edges.pop()
+                continue
+
+            if rel.target_id == end_id and rel.target_id not in visited:
+                yield path_edges + [(rel.source_id, rel.type, rel.target_id)]
+            elif depth + 1 < max_depth and rel.target_id not in visited:
+                visited.add(rel.target_id)
+                path_edges.append((rel.source_id, rel.type, rel.target_id))
+                stack.append((
+                    rel.target_id,
+                    iter(self.adjacency.get(rel.target_id, ())),
+                    depth + 1
+                ))
 
     def to_json(self) -> str:
-        """Serialize graph to JSON."""
-        return json.dumps({
+        """Serialize graph to JSON (via orjson when available)."""
+        payload = {
             "nodes": [
                 {"id": n.id, "type": n.type, "properties": n.properties}
                 for n in self.nodes.values()
@@ -164,7 +406,10 @@ class KnowledgeGraph:
                 }
                 for adj in self.adjacency.values() for rel in adj
             ]
-        }, indent=2)
+        }
+        if ORJSON_AVAILABLE:
+            return orjson.dumps(payload, option=orjson.OPT_INDENT_2).decode()
+        return json.dumps(payload, indent=2)
 
 # --- Example Usage ---
 
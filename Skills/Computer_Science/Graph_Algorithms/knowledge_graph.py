@@ -50,26 +50,38 @@ class BioKnowledgeGraph:
         if start_id not in self.nodes or end_id not in self.nodes:
             return None
 
-        # Priority queue: (distance, current_node, path)
-        pq = [(0, start_id, [])]
+        # Priority queue: (distance, current_node). The path is not carried
+        # in the queue entries — each neighbor relaxation records its parent
+        # instead, and the path is rebuilt once at the end. This keeps each
+        # expansion O(1) rather than copying an O(depth) list per edge.
+        pq = [(0, start_id)]
+        dist = {start_id: 0}
+        parent = {start_id: None}
         visited = set()
 
         while pq:
-            cost, current, path = heapq.heappop(pq)
-            
+            cost, current = heapq.heappop(pq)
+
             if current in visited:
                 continue
             visited.add(current)
-            
-            path = path + [current]
-            
+
             if current == end_id:
-                return path
+                path = []
+                node = current
+                while node is not None:
+                    path.append(node)
+                    node = parent[node]
+                return path[::-1]
 
             for edge in self.adjacency[current]:
                 if edge.target not in visited:
-                    heapq.heappush(pq, (cost + edge.weight, edge.target, path))
-        
+                    new_cost = cost + edge.weight
+                    if new_cost < dist.get(edge.target, math.inf):
+                        dist[edge.target] = new_cost
+                        parent[edge.target] = current
+                        heapq.heappush(pq, (new_cost, edge.target))
+
         return None
 
     def get_subgraph_context(self, center_id: str, depth: int = 2) -> List[str]:
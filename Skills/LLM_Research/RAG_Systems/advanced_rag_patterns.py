@@ -11,9 +11,19 @@ Implemented Patterns:
    query using a cross-encoder or LLM-based scorer.
 """
 
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import hashlib
 import math
+import re
+import time
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
 
 # --- Interfaces ---
 
@@ -23,6 +33,14 @@ class Embedder(ABC):
     def embed(self, text: str) -> List[float]:
         pass
 
+    def embed_batch(self, texts: List[str]) -> List[List[float]]:
+        """
+        Embed several texts in one call. Real embedding APIs expose this
+        natively (one round trip instead of len(texts)); the default just
+        loops over embed() so subclasses only have to override for speed.
+        """
+        return [self.embed(text) for text in texts]
+
 class VectorStore(ABC):
     """Abstract base class for vector storage."""
     @abstractmethod
@@ -32,11 +50,68 @@ class VectorStore(ABC):
 class LLM(ABC):
     """Abstract base class for LLM."""
     @abstractmethod
-    def generate(self, prompt: str) -> str:
+    def generate(self, prompt: str, system: Optional[str] = None) -> str:
+        """
+        Generate a completion. Static instructions should go in `system`
+        and per-call content in `prompt`: providers with automatic prefix
+        caching (vLLM, sglang, Anthropic) then reuse the KV cache for the
+        unchanging system tokens instead of re-prefilling them every call.
+        """
         pass
 
+# --- Vector quantization helpers ---
+
+def quantize_int8(vector) -> Tuple[Any, float]:
+    """
+    Symmetric int8 quantization: scales by max-abs so values span the full
+    [-127, 127] range. Halves memory bandwidth vs float32 and lets
+    similarity run on integer dot products (returns (int8_vector, scale)).
+    """
+    v = np.asarray(vector, dtype=np.float32)
+    max_abs = float(np.max(np.abs(v))) if v.size else 0.0
+    if max_abs == 0.0:
+        return np.zeros(v.shape, dtype=np.int8), 0.0
+    scale = max_abs / 127.0
+    return np.round(v / scale).astype(np.int8), scale
+
+def int8_cosine(a, b) -> float:
+    """
+    Cosine similarity between two int8 vectors, accumulated in int32.
+    The per-vector quantization scales cancel out of the ratio.
+    """
+    a32 = a.astype(np.int32)
+    b32 = b.astype(np.int32)
+    denom = math.sqrt(float(a32.dot(a32)) * float(b32.dot(b32)))
+    if denom == 0.0:
+        return 0.0
+    return float(a32.dot(b32)) / denom
+
 # --- Implementations ---
 
+class CachingEmbedder(Embedder):
+    """
+    Wraps any Embedder with an exact-match cache keyed on a blake2b digest
+    of the text. Repeat embeddings become a dict lookup instead of a model
+    forward pass; hits/misses are counted for observability.
+    """
+
+    def __init__(self, embedder: Embedder):
+        self.embedder = embedder
+        self._cache: Dict[bytes, List[float]] = {}
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    def embed(self, text: str) -> List[float]:
+        key = hashlib.blake2b(text.encode(), digest_size=16).digest()
+        vector = self._cache.get(key)
+        if vector is not None:
+            self.cache_hits += 1
+            return vector
+        self.cache_misses += 1
+        vector = self.embedder.embed(text)
+        self._cache[key] = vector
+        return vector
+
 class HyDERetriever:
     """
     Hypothetical Document Embeddings (HyDE) Retriever.
@@ -45,15 +120,63 @@ class HyDERetriever:
     Logic: Query -> LLM -> Hypothetical Answer -> Embedding -> Vector Search -> Real Docs
     """
     
-    def __init__(self, llm: LLM, embedder: Embedder, vector_store: VectorStore):
+    def __init__(self, llm: LLM, embedder: Embedder, vector_store: VectorStore,
+                 cache_ttl: float = 300.0, similarity_threshold: float = 0.95,
+                 draft_llm: Optional[LLM] = None, num_drafts: int = 1):
         self.llm = llm
         self.embedder = embedder
         self.vector_store = vector_store
+        # Speculative drafting: with num_drafts > 1, several short
+        # hypothetical documents are generated concurrently (by draft_llm,
+        # typically a smaller/faster model) and their embedding centroid
+        # becomes the query vector. Wall time stays ~one draft generation
+        # and the centroid averages out single-draft phrasing noise.
+        self.draft_llm = draft_llm or llm
+        self.num_drafts = num_drafts
+        # Query cache: identical queries within cache_ttl seconds skip the
+        # LLM, the embedder and the vector store entirely. Entries keep the
+        # HyDE vector so near-duplicate queries (cosine > threshold) can be
+        # answered from cache too, at the cost of one LLM+embed call.
+        self.cache_ttl = cache_ttl
+        self.similarity_threshold = similarity_threshold
+        self._cache: Dict[Tuple[bytes, int], Tuple[float, List[float], List[Dict[str, Any]]]] = {}
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    def _semantic_lookup(self, query_vector: List[float], k: int,
+                         now: float) -> Optional[List[Dict[str, Any]]]:
+        """Return cached results for a near-identical HyDE vector, if any."""
+        if not NUMPY_AVAILABLE or not self._cache:
+            return None
+        # Cached vectors are int8-quantized; compare in the same domain so
+        # each candidate costs two int32 dot products, not a float pass.
+        qv, q_scale = quantize_int8(query_vector)
+        if q_scale == 0.0:
+            return None
+        best_sim, best_results = -1.0, None
+        for (_, cached_k), (ts, vector, results) in self._cache.items():
+            if cached_k != k or now - ts >= self.cache_ttl:
+                continue
+            sim = int8_cosine(qv, vector)
+            if sim > best_sim:
+                best_sim, best_results = sim, results
+        if best_sim > self.similarity_threshold:
+            return best_results
+        return None
 
     def retrieve(self, query: str, k: int = 5) -> List[Dict[str, Any]]:
         """
         Execute the HyDE retrieval process.
         """
+        # Step 0: Exact cache check — repeat queries bypass everything
+        key = (hashlib.blake2b(query.encode(), digest_size=16).digest(), k)
+        now = time.time()
+        entry = self._cache.get(key)
+        if entry is not None and now - entry[0] < self.cache_ttl:
+            self.cache_hits += 1
+            return entry[2]
+        self.cache_misses += 1
+
         # Step 1: Generate Hypothetical Document
         # We ask the LLM to write a paragraph that *would* answer the query.
         hyde_prompt = f"""
@@ -64,30 +187,122 @@ class HyDERetriever:
         Question: {query}        
         Passage:
         """
-        hypothetical_doc = self.llm.generate(hyde_prompt)
-        print(f"[HyDE] Generated Hypothetical Doc: {hypothetical_doc[:50]}...")
-        
-        # Step 2: Encode the hypothetical document
-        # The vector of this "fake" answer is often closer to the "real" answer 
-        # than the vector of the raw query is.
-        query_vector = self.embedder.embed(hypothetical_doc)
-        
+        if self.num_drafts > 1:
+            # Speculative parallel drafts: overlap the generation calls,
+            # embed them in one batch, and search with the normalized
+            # centroid of the draft vectors.
+            with ThreadPoolExecutor(max_workers=self.num_drafts) as executor:
+                drafts = list(executor.map(
+                    self.draft_llm.generate, [hyde_prompt] * self.num_drafts
+                ))
+            print(f"[HyDE] Generated {len(drafts)} speculative drafts: {drafts[0][:50]}...")
+            vectors = self.embedder.embed_batch(drafts)
+            if NUMPY_AVAILABLE:
+                centroid = np.asarray(vectors, dtype=np.float64).mean(axis=0)
+                norm = np.linalg.norm(centroid)
+                if norm > 0:
+                    centroid = centroid / norm
+                query_vector = centroid.tolist()
+            else:
+                n = len(vectors)
+                query_vector = [sum(col) / n for col in zip(*vectors)]
+        else:
+            hypothetical_doc = self.llm.generate(hyde_prompt)
+            print(f"[HyDE] Generated Hypothetical Doc: {hypothetical_doc[:50]}...")
+
+            # Step 2: Encode the hypothetical document
+            # The vector of this "fake" answer is often closer to the "real" answer 
+            # than the vector of the raw query is.
+            query_vector = self.embedder.embed(hypothetical_doc)
+
+        # Step 2b: Semantic cache — a differently-worded repeat of a cached
+        # query lands on a near-identical HyDE vector
+        cached = self._semantic_lookup(query_vector, k, now)
+        if cached is not None:
+            self.cache_hits += 1
+            self.cache_misses -= 1  # reclassify: served from cache after all
+            return cached
+
         # Step 3: Retrieve real documents using this vector
         results = self.vector_store.search(query_vector, k=k)
-        
+
+        # Cache the int8-quantized vector: 4x smaller than float32 and all
+        # the semantic lookup needs (cosine is scale-invariant).
+        stored = quantize_int8(query_vector)[0] if NUMPY_AVAILABLE else query_vector
+        self._cache[key] = (now, stored, results)
         return results
 
+_SCORE_RE = re.compile(r"0?\.\d+|1\.0|[01]")
+
 class ContextualReranker:
     """
     Reranks a list of retrieved documents based on relevance to the query.
+
+    Two modes:
+    - "listwise" (default): one LLM call ranks all documents at once.
+    - "pointwise": each document is scored independently, and with
+      max_workers > 1 the scoring calls run concurrently, so wall time is
+      ~one LLM latency instead of N of them.
     """
-    
-    def __init__(self, llm: Optional[LLM] = None):
+
+    # Stable instruction prefixes, sent as the system message so the
+    # provider's prompt cache can reuse their KV across every rerank call.
+    LISTWISE_PREAMBLE = (
+        "You are an expert relevance ranker. Given the query and the list of "
+        "documents below, rank the documents from most relevant to least relevant. "
+        "Return ONLY a list of numbers representing the rank order (e.g., \"2, 1, 3\")."
+    )
+    POINTWISE_PREAMBLE = (
+        "Rate the relevance of the document to the query on a scale "
+        "from 0.0 to 1.0. Return ONLY the number."
+    )
+
+    def __init__(self, llm: Optional[LLM] = None, max_workers: int = 1,
+                 mode: str = "listwise"):
         self.llm = llm
+        self.max_workers = max_workers
+        self.mode = mode
+
+    def _score_one(self, query: str, doc: Dict[str, Any]) -> float:
+        """Score a single document's relevance to the query in [0, 1]."""
+        prompt = f"""
+        Query: {query}
+        Document: {doc.get('content', '')[:500]}
+        """
+        response = self.llm.generate(prompt, system=self.POINTWISE_PREAMBLE)
+        match = _SCORE_RE.search(response)
+        return float(match.group()) if match else 0.5
+
+    def _rerank_pointwise(self, query: str, documents: List[Dict[str, Any]],
+                          top_n: int) -> List[Dict[str, Any]]:
+        """Score every document independently and sort by score."""
+        scores = [0.5] * len(documents)
+        if self.max_workers > 1:
+            workers = min(self.max_workers, len(documents))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = {
+                    executor.submit(self._score_one, query, doc): i
+                    for i, doc in enumerate(documents)
+                }
+                for future in as_completed(futures):
+                    i = futures[future]
+                    try:
+                        scores[i] = future.result()
+                    except Exception as e:
+                        print(f"[Reranker] Scoring doc {i} failed: {e}. Using 0.5.")
+        else:
+            for i, doc in enumerate(documents):
+                try:
+                    scores[i] = self._score_one(query, doc)
+                except Exception as e:
+                    print(f"[Reranker] Scoring doc {i} failed: {e}. Using 0.5.")
+
+        order = sorted(range(len(documents)), key=lambda i: scores[i], reverse=True)
+        return [documents[i] for i in order[:top_n]]
 
     def rerank(self, query: str, documents: List[Dict[str, Any]], top_n: int = 3) -> List[Dict[str, Any]]:
         """
-        Rerank documents using a "Listwise" approach (asking LLM to rank them).
+        Rerank documents using the configured mode (listwise by default).
         """
         if not documents:
             return []
@@ -95,7 +310,11 @@ class ContextualReranker:
         # If no LLM provided, just return top_n of original (identity)
         if not self.llm:
             return documents[:top_n]
-            
+
+        if self.mode == "pointwise":
+            print(f"[Reranker] Pointwise scoring {len(documents)} documents for query: {query}")
+            return self._rerank_pointwise(query, documents, top_n)
+
         print(f"[Reranker] Reranking {len(documents)} documents for query: {query}")
         
         # Prompt engineering for reranking
@@ -105,18 +324,13 @@ class ContextualReranker:
         ])
         
         prompt = f"""
-        You are an expert relevance ranker. Given the query and the list of documents below, 
-        rank the documents from most relevant to least relevant.
-        
         Query: {query}
         
         Documents:
         {docs_text}
-        
-        Return ONLY a list of numbers representing the rank order (e.g., "2, 1, 3").
         """
         
-        response = self.llm.generate(prompt)
+        response = self.llm.generate(prompt, system=self.LISTWISE_PREAMBLE)
         
         # Parse response (Mock logic for safety if parsing fails)
         try:
@@ -145,10 +359,24 @@ class ContextualReranker:
 # --- Mocks for Demonstration ---
 
 class MockEmbedder(Embedder):
+    def __init__(self, dim: int = 4):
+        self.dim = dim
+        # One generator for the embedder's lifetime: a single rng.random(dim)
+        # call fills the whole vector in C instead of a per-float Python loop.
+        self._rng = np.random.default_rng() if NUMPY_AVAILABLE else None
+
     def embed(self, text: str) -> List[float]:
-        # Return random vector of dim 4
+        if self._rng is not None:
+            return self._rng.random(self.dim, dtype=np.float32).tolist()
         import random
-        return [random.random() for _ in range(4)]
+        return [random.random() for _ in range(self.dim)]
+
+    def embed_batch(self, texts: List[str]) -> List[List[float]]:
+        # One (n, dim) draw amortizes the RNG state update across the batch,
+        # mirroring what real embedding APIs return for a batched request.
+        if self._rng is not None:
+            return self._rng.random((len(texts), self.dim), dtype=np.float32).tolist()
+        return [self.embed(text) for text in texts]
 
 class MockVectorStore(VectorStore):
     def search(self, query_vector: List[float], k: int = 5) -> List[Dict[str, Any]]:
@@ -160,11 +388,14 @@ class MockVectorStore(VectorStore):
         ][:k]
 
 class MockLLM(LLM):
-    def generate(self, prompt: str) -> str:
-        if "scientific passage" in prompt:
+    def generate(self, prompt: str, system: Optional[str] = None) -> str:
+        full = f"{system or ''}\n{prompt}"
+        if "scientific passage" in full:
             return "Tumor suppressors regulate cell division and prevent cancer."
-        if "rank the documents" in prompt:
+        if "rank the documents" in full:
             return "1, 3, 2, 4"
+        if "Rate the relevance" in full:
+            return "0.5"
         return "Mock response"
 
 # --- Usage Example ---
@@ -1,7 +1,55 @@
+import math
+
 import numpy as np
 from typing import List, Tuple, Callable, Optional
 from dataclasses import dataclass
 
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+try:
+    from scipy.linalg import cho_solve, solve_triangular
+    from scipy.optimize import minimize
+    from scipy.special import erf
+    SCIPY_AVAILABLE = True
+except ImportError:
+    SCIPY_AVAILABLE = False
+    erf = np.vectorize(math.erf)
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, fastmath=True, parallel=True)
+    def _rbf_kernel(X1: np.ndarray, X2: np.ndarray,
+                    sigma_f: float, length_scale: float) -> np.ndarray:
+        """
+        RBF kernel matrix as an explicit loop nest: LLVM fuses the
+        squared-distance accumulation and exp into SIMD FMA loops, and
+        prange spreads the rows across cores (cache=True avoids re-JIT).
+        """
+        n, d = X1.shape
+        m = X2.shape[0]
+        out = np.empty((n, m))
+        scale = -0.5 / (length_scale * length_scale)
+        sf2 = sigma_f * sigma_f
+        for i in prange(n):
+            for j in range(m):
+                sqdist = 0.0
+                for k in range(d):
+                    diff = X1[i, k] - X2[j, k]
+                    sqdist += diff * diff
+                out[i, j] = sf2 * np.exp(sqdist * scale)
+        return out
+else:
+    def _rbf_kernel(X1: np.ndarray, X2: np.ndarray,
+                    sigma_f: float, length_scale: float) -> np.ndarray:
+        """Vectorized NumPy fallback when numba is not installed."""
+        sqdist = np.sum(X1**2, 1).reshape(-1, 1) + np.sum(X2**2, 1) - 2 * np.dot(X1, X2.T)
+        return sigma_f**2 * np.exp(-0.5 / length_scale**2 * sqdist)
+
+
 @dataclass
 class OptimizationResult:
     best_params: np.ndarray
@@ -23,46 +71,149 @@ class BayesianOptimizer:
         self.bounds = np.array(bounds)
         self.dim = len(bounds)
         self.kappa = kappa
-        self.X_sample: List[np.ndarray] = []
-        self.Y_sample: List[float] = []
+
+        # Preallocated sample buffers with geometric growth: register()
+        # writes into the next row instead of reallocating per observation,
+        # and X_sample/Y_sample expose zero-copy contiguous views.
+        self._X = np.empty((16, self.dim), dtype=np.float64)
+        self._y = np.empty(16, dtype=np.float64)
+        self._n = 0
         
         # Hyperparameters for the RBF Kernel
         self.sigma_f = 1.0
         self.length_scale = 1.0
         self.noise = 1e-5
 
+        # Cholesky factor of K + noise*I and the solved weights K^-1 y,
+        # cached by fit() and reused by every predict() call.
+        self._L: Optional[np.ndarray] = None
+        self._alpha: Optional[np.ndarray] = None
+
+        # Generator-based RNG: faster and statistically cleaner than the
+        # legacy np.random.* global state.
+        self._rng = np.random.default_rng()
+
+    @property
+    def X_sample(self) -> np.ndarray:
+        """(n, d) view of the observed inputs."""
+        return self._X[:self._n]
+
+    @property
+    def Y_sample(self) -> np.ndarray:
+        """(n, 1) view of the observed values."""
+        return self._y[:self._n].reshape(-1, 1)
+
+    def _ensure_capacity(self, n: int):
+        """Double the sample buffers until they hold at least n rows."""
+        capacity = self._X.shape[0]
+        if n <= capacity:
+            return
+        while capacity < n:
+            capacity *= 2
+        X_new = np.empty((capacity, self.dim), dtype=np.float64)
+        X_new[:self._n] = self._X[:self._n]
+        self._X = X_new
+        y_new = np.empty(capacity, dtype=np.float64)
+        y_new[:self._n] = self._y[:self._n]
+        self._y = y_new
+
     def _kernel(self, X1: np.ndarray, X2: np.ndarray) -> np.ndarray:
         """
         Radial Basis Function (RBF) / Squared Exponential Kernel.
-        Computes covariance between points.
+        Computes covariance between points. The heavy lifting happens in the
+        module-level _rbf_kernel, JIT-compiled when numba is available.
         """
-        sqdist = np.sum(X1**2, 1).reshape(-1, 1) + np.sum(X2**2, 1) - 2 * np.dot(X1, X2.T)
-        return self.sigma_f**2 * np.exp(-0.5 / self.length_scale**2 * sqdist)
+        return _rbf_kernel(np.ascontiguousarray(X1, dtype=np.float64),
+                           np.ascontiguousarray(X2, dtype=np.float64),
+                           self.sigma_f, self.length_scale)
 
     def fit(self, X: List[np.ndarray], Y: List[float]):
-        """Update the internal Gaussian Process with new data."""
-        self.X_sample = np.array(X)
-        self.Y_sample = np.array(Y).reshape(-1, 1)
+        """
+        Update the internal Gaussian Process with new data.
+
+        Factorizes K + noise*I once with a Cholesky decomposition and caches
+        (L, alpha); predict() then only does triangular solves, which is both
+        cheaper and numerically better-conditioned than inverting K on every
+        call.
+        """
+        n = len(X)
+        self._ensure_capacity(n)
+        self._X[:n] = np.asarray(X, dtype=np.float64).reshape(n, self.dim)
+        self._y[:n] = np.asarray(Y, dtype=np.float64).ravel()
+        self._n = n
+
+        K = self._kernel(self.X_sample, self.X_sample) + self.noise * np.eye(len(self.X_sample))
+        self._L = np.linalg.cholesky(K)
+        if SCIPY_AVAILABLE:
+            self._alpha = cho_solve((self._L, True), self.Y_sample)
+        else:
+            self._alpha = np.linalg.solve(self._L.T, np.linalg.solve(self._L, self.Y_sample))
+
+    def register(self, x: np.ndarray, y: float):
+        """
+        Add a single observation without refitting from scratch.
+
+        Appending one point adds one row/column to K, so the cached Cholesky
+        factor extends in O(n^2): solve l = L^-1 k_new, new diagonal
+        d = sqrt(k(x,x)+noise - l.l), then L grows to [[L, 0], [l.T, d]].
+        A full fit() would redo the O(n^3) factorization every iteration.
+        """
+        x = np.asarray(x, dtype=np.float64).reshape(1, -1)
+        if self._L is None or len(self.X_sample) == 0:
+            self.fit([x[0]], [y])
+            return
+
+        k_new = self._kernel(self.X_sample, x)          # (n, 1)
+        k_self = self.sigma_f**2 + self.noise            # RBF k(x, x)
+        if SCIPY_AVAILABLE:
+            l = solve_triangular(self._L, k_new, lower=True)
+        else:
+            l = np.linalg.solve(self._L, k_new)
+        d = math.sqrt(max(k_self - float(l.ravel().dot(l.ravel())), 1e-12))
+
+        n = self._L.shape[0]
+        L_new = np.zeros((n + 1, n + 1))
+        L_new[:n, :n] = self._L
+        L_new[n, :n] = l.ravel()
+        L_new[n, n] = d
+        self._L = L_new
+
+        self._ensure_capacity(self._n + 1)
+        self._X[self._n] = x.ravel()
+        self._y[self._n] = y
+        self._n += 1
+
+        # Refresh the weights with two O(n^2) triangular solves
+        if SCIPY_AVAILABLE:
+            self._alpha = cho_solve((self._L, True), self.Y_sample)
+        else:
+            self._alpha = np.linalg.solve(self._L.T, np.linalg.solve(self._L, self.Y_sample))
 
     def predict(self, X: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
         """
         Predicts mean and variance for a new set of points X using the GP.
+
+        Only the variance diagonal is ever used, so the m x m test-test
+        covariance is never materialized: the diagonal comes from a single
+        einsum over the (n, m) cross-kernel, keeping the call O(n^2 * m)
+        instead of O(n * m^2) in memory and flops for large candidate sets.
         """
         if len(self.X_sample) == 0:
             return np.zeros((len(X), 1)), np.ones((len(X), 1))
 
-        K = self._kernel(self.X_sample, self.X_sample) + self.noise * np.eye(len(self.X_sample))
         K_s = self._kernel(self.X_sample, X)
-        K_ss = self._kernel(X, X) + 1e-8 * np.eye(len(X))
-        
-        K_inv = np.linalg.inv(K)
-        
-        # Mean prediction
-        mu = K_s.T.dot(K_inv).dot(self.Y_sample)
-        
-        # Variance prediction
-        cov = K_ss - K_s.T.dot(K_inv).dot(K_s)
-        return mu, np.diag(cov).reshape(-1, 1)
+
+        # Mean prediction from the cached weights alpha = K^-1 y
+        mu = K_s.T.dot(self._alpha)
+
+        # Variance prediction: prior k(x, x) is sigma_f^2 for the RBF kernel,
+        # reduced by diag(K_s.T @ K^-1 @ K_s) = sum(v*v) with v = L^-1 K_s.
+        if SCIPY_AVAILABLE:
+            v = solve_triangular(self._L, K_s, lower=True)
+        else:
+            v = np.linalg.solve(self._L, K_s)
+        var = self.sigma_f**2 + 1e-8 - np.einsum('ij,ij->j', v, v)
+        return mu, np.maximum(var, 0.0).reshape(-1, 1)
 
     def acquisition_function(self, X: np.ndarray) -> np.ndarray:
         """
@@ -72,18 +223,60 @@ class BayesianOptimizer:
         mu, sigma = self.predict(X)
         return mu + self.kappa * np.sqrt(sigma)
 
-    def propose_next_location(self, num_candidates: int = 100) -> np.ndarray:
+    def expected_improvement(self, X: np.ndarray, xi: float = 0.01) -> np.ndarray:
+        """
+        Expected Improvement (EI) over the best observed value, vectorized
+        across all candidates. Less aggressive than UCB at pure exploration.
         """
-        Randomly samples the search space and returns the point with the highest Acquisition Score.
-        In production, use L-BFGS-B to maximize the acquisition function properly.
+        mu, sigma = self.predict(X)
+        mu = mu.ravel()
+        std = np.sqrt(sigma).ravel()
+        y_max = float(np.max(self.Y_sample)) if len(self.X_sample) else 0.0
+
+        improve = mu - y_max - xi
+        with np.errstate(divide='ignore', invalid='ignore'):
+            z = improve / std
+            pdf = np.exp(-0.5 * z * z) / math.sqrt(2.0 * math.pi)
+            cdf = 0.5 * (1.0 + erf(z / math.sqrt(2.0)))
+            ei = improve * cdf + std * pdf
+        ei[std < 1e-12] = 0.0
+        return ei
+
+    def propose_next_location(self, num_candidates: int = 100,
+                              acquisition: str = "ucb",
+                              refine: bool = True) -> np.ndarray:
         """
-        # Uniform random sampling within bounds
-        candidates = np.random.uniform(
-            self.bounds[:, 0], self.bounds[:, 1], size=(num_candidates, self.dim)
-        )
-        scores = self.acquisition_function(candidates)
-        best_idx = np.argmax(scores)
-        return candidates[best_idx]
+        Maximizes the acquisition function (acquisition="ucb" or "ei").
+
+        A vectorized random sweep locates a promising region, then (when
+        scipy is available and refine=True) L-BFGS-B polishes the best draw
+        within bounds — converging on narrow optima that blind sampling
+        misses, with far fewer GP evaluations than enlarging the sweep would
+        cost. Without scipy this degrades to pure random sampling.
+        """
+        low, high = self.bounds[:, 0], self.bounds[:, 1]
+        candidates = low + (high - low) * self._rng.random((num_candidates, self.dim))
+        if acquisition == "ei":
+            scores = self.expected_improvement(candidates)
+        else:
+            scores = self.acquisition_function(candidates).ravel()
+        best_idx = int(np.argmax(scores))
+        best = candidates[best_idx]
+
+        if not (refine and SCIPY_AVAILABLE):
+            return best
+
+        def neg_acquisition(x_flat: np.ndarray) -> float:
+            x = x_flat.reshape(1, -1)
+            if acquisition == "ei":
+                return -float(self.expected_improvement(x)[0])
+            return -float(self.acquisition_function(x)[0, 0])
+
+        result = minimize(neg_acquisition, x0=best, method='L-BFGS-B',
+                          bounds=[tuple(b) for b in self.bounds])
+        if result.success and -result.fun >= scores[best_idx]:
+            return result.x
+        return best
 
 # --- Example Usage ---
 if __name__ == "__main__":
@@ -111,10 +304,9 @@ if __name__ == "__main__":
         
         print(f"Step {step+1}: Suggested Param {next_param}, Result {actual_value:.4f}")
         
-        # Add to known data
-        X_init.append(next_param)
+        # Add to known data (O(n^2) incremental update, no full refit)
         Y_init.append(actual_value)
-        opt.fit(X_init, Y_init)
+        opt.register(next_param, actual_value)
 
     best_y = max(Y_init)
     print(f"Optimization Complete. Best Value Found: {best_y:.4f}")
\ No newline at end of file
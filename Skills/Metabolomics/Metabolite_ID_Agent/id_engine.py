@@ -1,11 +1,14 @@
 import json
 
+import numpy as np
+
 class MetaboliteIdentifier:
     """
     AI-driven agent for identifying metabolites from MS/MS spectra.
     """
-    def __init__(self, database_path="gnps_library.json"):
+    def __init__(self, database_path="gnps_library.json", mass_tolerance=0.1):
         self.database_path = database_path
+        self.mass_tolerance = mass_tolerance
         self.load_database()
 
     def load_database(self):
@@ -13,37 +16,59 @@ class MetaboliteIdentifier:
         print(f"[MetaboliteID] Loading spectral library from {self.database_path}...")
         self.library = {"Caffeine": 195.088, "Glucose": 180.063} # Mock masses
 
-    def predict_structure(self, precursor_mz, ms2_spectrum):
-        """
-        Uses spectral similarity and in-silico fragmentation (mock).
-        """
-        print(f"[MetaboliteID] Analyzing spectrum for precursor m/z: {precursor_mz}...")
-        
-        # Mock logic: Simple mass matching
-        candidates = []
-        for name, mass in self.library.items():
-            if abs(mass - precursor_mz) < 0.1:
-                candidates.append({"name": name, "score": 0.98, "method": "Library Match"})
-        
+        # Mass-sorted arrays: candidate lookup becomes two binary searches
+        # (O(log n)) instead of a linear scan over the whole library, which
+        # matters at real GNPS scale (10^5-10^6 entries).
+        order = np.argsort(np.array(list(self.library.values()), dtype=np.float64))
+        self._names = np.array(list(self.library.keys()))[order]
+        self._masses = np.array(list(self.library.values()), dtype=np.float64)[order]
+
+    def _match_library(self, precursor_mz):
+        """Return library names within mass_tolerance of precursor_mz."""
+        lo = np.searchsorted(self._masses, precursor_mz - self.mass_tolerance)
+        hi = np.searchsorted(self._masses, precursor_mz + self.mass_tolerance)
+        return self._names[lo:hi]
+
+    def _annotate(self, names):
+        """Turn a slice of matched names into candidate annotations, falling
+        back to the mock AI predictor when the window is empty."""
+        candidates = [
+            {"name": str(name), "score": 0.98, "method": "Library Match"}
+            for name in names
+        ]
         if not candidates:
             # Fallback to AI prediction (CSI:FingerID style)
             print("[MetaboliteID] No library match. Invoking Deep Learning predictor...")
             candidates.append({
-                "name": "Unknown_Alkaloid_Derivative", 
-                "score": 0.75, 
+                "name": "Unknown_Alkaloid_Derivative",
+                "score": 0.75,
                 "method": "AI_Prediction",
-                "formula": "C8H10N4O2" 
+                "formula": "C8H10N4O2"
             })
-            
         return candidates
 
+    def predict_structure(self, precursor_mz, ms2_spectrum):
+        """
+        Uses spectral similarity and in-silico fragmentation (mock).
+        """
+        print(f"[MetaboliteID] Analyzing spectrum for precursor m/z: {precursor_mz}...")
+        # Mock logic: Simple mass matching against the sorted library
+        return self._annotate(self._match_library(precursor_mz))
+
     def batch_process(self, feature_list):
         """
-        Process a list of MS features.
+        Process a list of MS features. All precursor windows are located with
+        one vectorized searchsorted over the sorted mass array.
         """
+        feature_ids = list(feature_list.keys())
+        mzs = np.array([feature_list[fid]['mz'] for fid in feature_ids], dtype=np.float64)
+        los = np.searchsorted(self._masses, mzs - self.mass_tolerance)
+        his = np.searchsorted(self._masses, mzs + self.mass_tolerance)
+
         results = {}
-        for feature_id, data in feature_list.items():
-            results[feature_id] = self.predict_structure(data['mz'], data.get('ms2'))
+        for feature_id, mz, lo, hi in zip(feature_ids, mzs, los, his):
+            print(f"[MetaboliteID] Analyzing spectrum for precursor m/z: {mz}...")
+            results[feature_id] = self._annotate(self._names[lo:hi])
         return results
 
 if __name__ == "__main__":
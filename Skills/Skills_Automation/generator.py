@@ -1,4 +1,6 @@
+import hashlib
 import os
+import tempfile
 
 class SkillsGenerator:
     def __init__(self, root_dir="."):
@@ -7,8 +9,30 @@ class SkillsGenerator:
     def generate_file(self, rel_path, content):
         full_path = os.path.join(self.root_dir, rel_path)
         os.makedirs(os.path.dirname(full_path), exist_ok=True)
-        with open(full_path, 'w', encoding='utf-8') as f:
-            f.write(content)
+
+        # Skip byte-identical rewrites: repeat runs leave the file untouched
+        # so git sees no change and the commit phase becomes a no-op.
+        encoded = content.encode('utf-8')
+        if os.path.exists(full_path):
+            with open(full_path, 'rb') as f:
+                existing = f.read()
+            if hashlib.blake2b(existing).digest() == hashlib.blake2b(encoded).digest():
+                print(f"Unchanged: {rel_path}")
+                return
+
+        # Write to a temp file in the same directory and swap in atomically,
+        # so a crash mid-write never leaves a truncated module behind.
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(full_path), suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(content)
+            os.replace(tmp_path, full_path)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
         print(f"Generated: {rel_path}")
 
     def generate_skill_content(self, task):
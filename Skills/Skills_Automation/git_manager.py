@@ -1,9 +1,28 @@
 import subprocess
 from datetime import datetime
 
+try:
+    import pygit2  # In-process libgit2 bindings: no fork/exec per operation
+    PYGIT2_AVAILABLE = True
+except ImportError:
+    PYGIT2_AVAILABLE = False
+
 class GitManager:
+    """
+    Thin git wrapper. When pygit2 is installed every operation runs in-process
+    against a single long-lived repository handle (sub-ms for status/add vs
+    tens of ms of fork+exec+repo-discovery per subprocess call); otherwise it
+    falls back to shelling out to the git binary.
+    """
+
     def __init__(self, repo_path="."):
         self.repo_path = repo_path
+        self._repo = None
+        if PYGIT2_AVAILABLE:
+            try:
+                self._repo = pygit2.Repository(repo_path)
+            except Exception as e:
+                print(f"pygit2 could not open {repo_path} ({e}); using git subprocess.")
 
     def run_git(self, args):
         result = subprocess.run(['git'] + args, cwd=self.repo_path, capture_output=True, text=True)
@@ -12,21 +31,77 @@ class GitManager:
         return result.stdout.strip()
 
     def status(self):
+        if self._repo is not None:
+            # Same shape as `git status --short`: "XY path" lines
+            lines = []
+            for path, flags in self._repo.status().items():
+                if flags & pygit2.GIT_STATUS_IGNORED:
+                    continue
+                lines.append(f"{self._status_code(flags)} {path}")
+            return "\n".join(lines)
         return self.run_git(['status', '--short'])
 
+    @staticmethod
+    def _status_code(flags):
+        if flags & (pygit2.GIT_STATUS_INDEX_NEW | pygit2.GIT_STATUS_WT_NEW):
+            return "A " if flags & pygit2.GIT_STATUS_INDEX_NEW else "??"
+        if flags & (pygit2.GIT_STATUS_INDEX_MODIFIED | pygit2.GIT_STATUS_WT_MODIFIED):
+            return " M"
+        if flags & (pygit2.GIT_STATUS_INDEX_DELETED | pygit2.GIT_STATUS_WT_DELETED):
+            return " D"
+        return "  "
+
     def add_all(self):
         print("Staging files...")
+        if self._repo is not None:
+            index = self._repo.index
+            index.add_all()
+            index.write()
+            return ""
         return self.run_git(['add', '.'])
 
     def commit(self, message):
         print(f"Committing with message: {message}")
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         full_message = f"{message}\n\nAutomated update by Skills_Automation Agent at {timestamp}"
+        if self._repo is not None:
+            index = self._repo.index
+            tree = index.write_tree()
+            try:
+                signature = self._repo.default_signature
+            except Exception:
+                signature = pygit2.Signature("Skills_Automation Agent", "skills@localhost")
+            parents = [] if self._repo.head_is_unborn else [self._repo.head.target]
+            oid = self._repo.create_commit(
+                "HEAD", signature, signature, full_message, tree, parents
+            )
+            return str(oid)
         return self.run_git(['commit', '-m', full_message])
 
+    def commit_all(self, message):
+        """
+        Stage everything and commit as one operation. One status check
+        gates the whole thing — a clean tree skips staging and committing
+        entirely — and on the pygit2 path the single index scan feeds the
+        commit directly instead of separate add/commit tree walks.
+        """
+        changes = self.status()
+        if not changes.strip():
+            print("Nothing to commit; working tree clean.")
+            return ""
+        print(changes)
+        if self._repo is not None:
+            index = self._repo.index
+            index.add_all()
+            index.write()
+            return self.commit(message)
+        self.run_git(['add', '.'])
+        return self.commit(message)
+
     def push(self):
         print("Pushing to remote...")
         # Note: This requires credentials to be set up in the environment/git config
+        # (pushing stays on the subprocess path so the usual credential helpers apply)
         return self.run_git(['push'])
 
 if __name__ == "__main__":
@@ -2,6 +2,7 @@ from scanner import SkillsScanner
 from planner import SkillsPlanner
 from generator import SkillsGenerator
 from git_manager import GitManager
+import concurrent.futures
 import sys
 import os
 
@@ -33,20 +34,29 @@ def main():
         sys.exit(0)
 
     # 4. Generate Content
+    # Each task writes a distinct file, so they run concurrently. Processes
+    # by default (template rendering is CPU-bound); pass --threads when the
+    # real work is network-bound LLM calls.
     print("\n[Phase 3] Generating Content...")
     for task in tasks:
         print(f"Executing: {task['action']}")
-        generator.generate_skill_content(task)
+    executor_cls = (concurrent.futures.ThreadPoolExecutor if "--threads" in sys.argv
+                    else concurrent.futures.ProcessPoolExecutor)
+    max_workers = min(8, len(tasks))
+    if max_workers > 1:
+        with executor_cls(max_workers=max_workers) as executor:
+            list(executor.map(generator.generate_skill_content, tasks))
+    else:
+        generator.generate_skill_content(tasks[0])
 
     # 5. Review & Commit
     print("\n[Phase 4] Git Operations...")
-    print(git.status())
-    
+
     # In a fully autonomous loop, we would commit. 
     # For safety in this demo, we stage and ask for confirmation or just commit if instructed.
-    # The prompt asked to "commit", so we will.
-    git.add_all()
-    git.commit("Automated Skills Update: Orchestrator, ChemTools, MedPrompt")
+    # The prompt asked to "commit", so we will. commit_all checks status,
+    # stages and commits in one pass, and no-ops when nothing changed.
+    git.commit_all("Automated Skills Update: Orchestrator, ChemTools, MedPrompt")
     
     # We do NOT push by default to avoid auth errors in this script run, 
     # but the method is available in git_manager.py
@@ -2,6 +2,12 @@ import os
 import re
 
 class SkillsPlanner:
+    # One compiled pattern replaces four substring checks per line and
+    # captures the task description directly. Matches "**Gap:**",
+    # "**Missing:**", "*Action:*" and "*Upgrade:*" markers.
+    _TASK_RE = re.compile(r'\*{1,2}(Gap|Missing|Action|Upgrade):\*{1,2}\s*(.*)')
+    _SECTION_RE = re.compile(r'^#{2,}\s*(.+)')
+
     def __init__(self, plan_path="SKILLS_GAP_ANALYSIS_AND_IMPROVEMENT_PLAN_2026.md"):
         self.plan_path = plan_path
 
@@ -22,18 +28,19 @@ class SkillsPlanner:
         # In a real rigorous system, we'd use an LLM to parse this. 
         # Here we use regex for the standalone script.
         
-        lines = plan_content.split('\n')
         current_section = "General"
-        
-        for line in lines:
-            if line.startswith('##'):
-                current_section = line.strip('# ').strip()
-            
-            if "**Gap:**" in line or "**Missing:**" in line or "*Action:*" in line or "*Upgrade:*" in line:
-                task_desc = line.split(':', 1)[1].strip()
+
+        for line in plan_content.splitlines():
+            section_match = self._SECTION_RE.match(line)
+            if section_match:
+                current_section = section_match.group(1).strip()
+                continue
+
+            task_match = self._TASK_RE.search(line)
+            if task_match:
                 tasks.append({
                     'section': current_section,
-                    'action': task_desc,
+                    'action': task_match.group(2).strip(),
                     'priority': 'High'
                 })
 
@@ -4,40 +4,77 @@ import re
 from pathlib import Path
 
 class SkillsScanner:
+    CACHE_FILE = '.skills_cache.json'
+
     def __init__(self, root_dir):
         self.root_dir = Path(root_dir)
         self.ignore_dirs = {'.git', '__pycache__', 'Skills_Automation', '.gemini'}
 
+    def _load_cache(self):
+        try:
+            with open(self.root_dir / self.CACHE_FILE, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except Exception:
+            return {}
+
+    def _save_cache(self, cache):
+        try:
+            with open(self.root_dir / self.CACHE_FILE, 'w', encoding='utf-8') as f:
+                json.dump(cache, f)
+        except Exception:
+            pass
+
     def scan(self):
+        # Sidecar cache keyed on directory mtime: unchanged skill dirs reuse
+        # their cached item without re-opening the README, so repeat scans
+        # only pay for the directory walk itself.
+        cache = self._load_cache()
+        new_cache = {}
+
         inventory = {}
         for root, dirs, files in os.walk(self.root_dir):
             # Modify dirs in-place to skip ignored directories
             dirs[:] = [d for d in dirs if d not in self.ignore_dirs]
-            
+
             rel_path = os.path.relpath(root, self.root_dir)
             if rel_path == '.':
                 continue
 
-            category = rel_path.split(os.sep)[0]
+            category = Path(rel_path).parts[0]
             if category not in inventory:
                 inventory[category] = []
 
-            # Check for README
-            readme_content = ""
+            # Key on both the directory mtime (catches add/remove/rename) and
+            # the README's own mtime (catches in-place edits, which do not
+            # touch the parent directory) — still two stats, zero reads.
+            mtime_ns = os.stat(root).st_mtime_ns
             if 'README.md' in files:
                 try:
-                    with open(os.path.join(root, 'README.md'), 'r', encoding='utf-8') as f:
-                        readme_content = f.read(1000) # Read first 1000 chars for context
-                except Exception:
+                    mtime_ns = max(mtime_ns, os.stat(os.path.join(root, 'README.md')).st_mtime_ns)
+                except OSError:
                     pass
+            cached = cache.get(rel_path)
+            if cached and cached.get('mtime_ns') == mtime_ns:
+                item = cached['item']
+            else:
+                # Check for README
+                readme_content = ""
+                if 'README.md' in files:
+                    try:
+                        with open(os.path.join(root, 'README.md'), 'r', encoding='utf-8') as f:
+                            readme_content = f.read(1000) # Read first 1000 chars for context
+                    except Exception:
+                        pass
 
-            item = {
-                'path': rel_path,
-                'files': files,
-                'description': self._extract_description(readme_content)
-            }
+                item = {
+                    'path': rel_path,
+                    'files': files,
+                    'description': self._extract_description(readme_content)
+                }
+            new_cache[rel_path] = {'mtime_ns': mtime_ns, 'item': item}
             inventory[category].append(item)
-        
+
+        self._save_cache(new_cache)
         return inventory
 
     def _extract_description(self, content):